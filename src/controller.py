@@ -239,16 +239,11 @@ class Controller(QWidget):
         try:
             dialog = PersonalityCreatorDialog(self.view)
             if dialog.exec_():  # User clicked 'Save / Create'
-                result_json = dialog.get_result_json()
-                if not result_json:
+                data = dialog.get_result_dict()
+                if not data:
                     self.view.show_error("Creation Failed", "No data was returned from the dialog.")
                     return
-
-                try:
-                    data = json.loads(result_json)
-                except json.JSONDecodeError as e:
-                    self.view.show_error("Invalid JSON", f"Could not decode personality data: {e}")
-                    return
+                result_json = dialog.get_result_json()
 
                 # Append to in-memory personality list
                 self.personalities.append({
@@ -288,16 +283,11 @@ class Controller(QWidget):
 
             dialog = PersonalityCreatorDialog(self.view, selected_personality)
             if dialog.exec_():  # User clicked 'Save / Create'
-                result_json = dialog.get_result_json()
-                if not result_json:
+                data = dialog.get_result_dict()
+                if not data:
                     self.view.show_error("Edit Failed", "No data was returned from the dialog.")
                     return
-
-                try:
-                    data = json.loads(result_json)
-                except json.JSONDecodeError as e:
-                    self.view.show_error("Invalid JSON", f"Could not decode personality data: {e}")
-                    return
+                result_json = dialog.get_result_json()
 
                 # Update in-memory personality list
                 selected_personality["name"] = data.get("My name", selected_personality["name"])
@@ -5,21 +5,11 @@ from typing import Optional
 from PyQt5.QtCore import QTimer, QEvent, pyqtSignal, Qt
 from PyQt5.QtWidgets import (
     QPushButton,
-    QWidget, QHBoxLayout, QVBoxLayout, QSizePolicy
+    QWidget, QHBoxLayout, QVBoxLayout, QSizePolicy, QSpacerItem
 )
 
 from src.minimum_size_browser import InputChatBubble
 
-class HSpacer(QWidget):
-    """
-    Horizontal spacer that can be used to help align widgets
-    """
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)  # todo make sure this is okay
-        self.setAttribute(Qt.WA_TransparentForMouseEvents)  # don’t block clicks
-        self.setStyleSheet("background: transparent; border: none;")
-
 class ChatInputBar(QWidget):
     userMsgSentSignal = pyqtSignal(str)
     stopRequested = pyqtSignal()
@@ -49,7 +39,7 @@ class ChatInputBar(QWidget):
         btn_row.setSpacing(8)
 
         btn_row.addWidget(self.clear_btn)
-        btn_row.addWidget(HSpacer())
+        btn_row.addSpacerItem(QSpacerItem(0, 0, QSizePolicy.Expanding, QSizePolicy.Preferred))
         btn_row.addWidget(self.stop_btn)
         btn_row.addWidget(self.send_btn)
 
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import logging
+import re
+
 from PyQt5.QtCore import QTimer, QEvent, pyqtSignal, Qt, QSize
 from PyQt5.QtGui import QColor, QGuiApplication, QTextCursor, QTextDocument, \
     QPainter
 from PyQt5.QtWidgets import (
     QWidget, QFrame, QHBoxLayout, QVBoxLayout, QToolButton,
-    QSizePolicy
+    QSizePolicy, QSpacerItem, QListWidgetItem
 )
 from markdown_it import MarkdownIt
+from markdown_it.common.utils import escapeHtml
 
 from src.minimum_size_browser import MessageBubble
 
@@ -15,15 +19,92 @@ from src.minimum_size_browser import MessageBubble
 md = MarkdownIt()
 md = md.disable(["html_block", "html_inline"])
 
-class HSpacer(QWidget):
+_logger = logging.getLogger("app")
+
+# token types that make up plain prose (paragraphs of text with soft line breaks)
+_PLAIN_BLOCK_TOKENS = frozenset(("paragraph_open", "inline", "paragraph_close"))
+_PLAIN_INLINE_TOKENS = frozenset(("text", "softbreak"))
+
+# opening/closing line of a fenced code block
+_FENCE_RE = re.compile(r" {0,3}(`{3,}|~{3,})(.*)")
+# line that starts a list item; items separated by blank lines still form one list
+_LIST_ITEM_RE = re.compile(r" {0,3}(?:[-+*]|\d{1,9}[.)])(?:[ \t]|$)")
+# line that may define a link reference, which resolves links anywhere in the text
+_REF_DEF_RE = re.compile(r"^[ \t>]*(?:(?:[-+*]|\d{1,9}[.)])[ \t]+)?\[[^\]\n]+\]:", re.MULTILINE)
+
+
+def find_stable_cut(text: str, start: int = 0) -> int:
     """
-    Horizontal spacer that can be used to help align widgets
+    Return the offset (>= start) up to which *text* is made of finished blocks: the
+    start of a complete, unindented line that follows a blank line outside a code
+    fence.
+
+    The cut never splits a list (a loose list rendered in two pieces becomes two lists).
     """
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)  # todo make sure this is okay
-        self.setAttribute(Qt.WA_TransparentForMouseEvents)  # don’t block clicks
-        self.setStyleSheet("background: transparent; border: none;")
+    cut = start
+    fence = ""
+    prev_blank = False
+    in_list = False
+    pos = start
+    while True:
+        nl = text.find("\n", pos)
+        line = text[pos:] if nl == -1 else text[pos:nl]
+        blank = not line.strip()
+
+        if nl != -1 and not fence and prev_blank and not blank and line[0] not in " \t":
+            is_item = _LIST_ITEM_RE.match(line) is not None
+            if not (in_list and is_item):
+                cut = pos
+                in_list = False
+
+        m = _FENCE_RE.match(line)
+        if fence:
+            if m and m.group(1)[0] == fence[0] and len(m.group(1)) >= len(fence) and not m.group(2).strip():
+                fence = ""
+        elif m and not (m.group(1)[0] == "`" and "`" in m.group(2)):
+            # a backtick in the rest of the line makes it inline code, not a fence
+            fence = m.group(1)
+        elif _LIST_ITEM_RE.match(line):
+            in_list = True
+
+        prev_blank = blank and not fence
+        if nl == -1:
+            return cut
+        pos = nl + 1
+
+
+def advance_stable_prefix(text: str, stable_len: int, stable_html: str) -> tuple[int, str]:
+    """
+    Extend the cached (length, HTML) prefix of *text* with newly finished blocks.
+    A link reference definition changes how earlier and later links render, so once
+    one shows up nothing is cached and the whole text is rendered each time.
+    """
+    if _REF_DEF_RE.search(text, stable_len):
+        return 0, ""
+    cut = find_stable_cut(text, stable_len)
+    if cut > stable_len:
+        stable_html += render_markdown(text[stable_len:cut])
+        stable_len = cut
+    return stable_len, stable_html
+
+
+def render_markdown(text: str) -> str:
+    """
+    Render markdown to HTML. Most streamed text is plain prose, so when every token is
+    a paragraph of text the HTML is built directly and the renderer is skipped.
+    """
+    tokens = md.parse(text)
+    for tok in tokens:
+        if tok.type not in _PLAIN_BLOCK_TOKENS or (
+                tok.children and any(c.type not in _PLAIN_INLINE_TOKENS for c in tok.children)):
+            return md.renderer.render(tokens, md.options, {})
+
+    parts = []
+    for tok in tokens:
+        if tok.type == "inline":
+            body = "".join(escapeHtml(c.content) if c.type == "text" else "\n" for c in tok.children or ())
+            parts.append(f"<p>{body}</p>\n")
+    return "".join(parts)
 
 class TypingIndicator(QWidget):
     def __init__(self, parent: QWidget | None = None):
@@ -34,6 +115,12 @@ class TypingIndicator(QWidget):
         self.spacing = 50
         self.color = QColor(255, 255, 255, int(0.5 * 255))
         self.timer = QTimer(self)
+
+        # geometry that never changes is computed once instead of on every paint
+        self._half_r = self.dot_radius // 2
+        self._total_width = (self.dot_count - 1) * self.spacing + self.dot_radius
+        self._dot_xs: tuple[int, ...] = ()
+        self._center_y = 0
         QTimer.singleShot(10, self.update_frame)
 
         self.setMinimumSize(self.spacing * (self.dot_count-1) + self.dot_radius * self.dot_count + 15, self.dot_radius + self.spacing * 2)
@@ -46,24 +133,28 @@ class TypingIndicator(QWidget):
 
         self.update()  # triggers paintEvent
 
+    def _recompute_geometry(self) -> None:
+        """Cache the dot x-positions and vertical center for the current widget size."""
+        start_x = (self.width() - self._total_width) // 2
+        self._dot_xs = tuple(start_x + i * self.spacing - self._half_r for i in range(self.dot_count))
+        self._center_y = self.height() // 2 - self._half_r
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._recompute_geometry()
 
     def paintEvent(self, event):
+        if not self._dot_xs:
+            self._recompute_geometry()
         painter = QPainter(self)
-        center_y = self.height() // 2
-        total_width = (self.dot_count - 1) * self.spacing + self.dot_radius
-        start_x = (self.width() - total_width) // 2
+        # brush and pen are the same for every dot, so set them once
+        painter.setBrush(self.color)
+        painter.setPen(Qt.NoPen)
 
-        for i in range(self.dot_count):
-            x = start_x + i * self.spacing
+        r = self.dot_radius
+        for i, x in enumerate(self._dot_xs):
             offset = -20 if i == self.current_frame else 0  # bounce effect
-            painter.setBrush(self.color)
-            painter.setPen(Qt.NoPen)
-            painter.drawEllipse(
-                x - self.dot_radius // 2,
-                center_y + offset - self.dot_radius // 2,
-                self.dot_radius,
-                self.dot_radius
-            )
+            painter.drawEllipse(x, self._center_y + offset, r, r)
         self.current_frame += 1
         if self.current_frame > self.dot_count:
             self.current_frame = 0
@@ -73,6 +164,8 @@ class MessageFrame(QFrame):
     def __init__(self, role: str, parent: QWidget = None):
         super().__init__(parent)
         self.role = role
+        # list row showing this frame; set by ChatScrollArea when the frame is inserted
+        self._row_item: QListWidgetItem | None = None
         # todo make the progress bubble look nicer.
 
 class ProgressIndicator(MessageFrame):
@@ -82,7 +175,7 @@ class ProgressIndicator(MessageFrame):
         msg_frame_hbox.setContentsMargins(20, 20, 20, 20)
         msg_frame_hbox.setSpacing(20)
         msg_frame_hbox.addWidget(TypingIndicator(self))
-        msg_frame_hbox.addWidget(HSpacer(self))
+        msg_frame_hbox.addSpacerItem(QSpacerItem(0, 0, QSizePolicy.Expanding, QSizePolicy.Preferred))
 
     def update_boundaries(self, parent_w):
         pass
@@ -96,6 +189,9 @@ class ChatMessageFrame(MessageFrame):
     def __init__(self, role: str, md_buffer: str="", parent: QWidget = None):
         super().__init__(role, parent)
         self._md_buffer = md_buffer
+        # finished blocks are rendered once and kept; only the tail is re-rendered per chunk
+        self._stable_md_len = 0
+        self._stable_html = ""
         self._build_ui()
         # setup the copy button stuff (may move this to a helper later)
         self._copy_button.setText("Copy")
@@ -141,7 +237,7 @@ class ChatMessageFrame(MessageFrame):
         copy_button = QToolButton(actions_row)
 
         # populate the action row
-        actions_row_hbox.addWidget(HSpacer())
+        actions_row_hbox.addSpacerItem(QSpacerItem(0, 0, QSizePolicy.Expanding, QSizePolicy.Preferred))
         actions_row_hbox.addWidget(copy_button)
 
         bubble_vbox.addWidget(browser)
@@ -150,11 +246,11 @@ class ChatMessageFrame(MessageFrame):
         browser.setProperty("variant", self.role)
 
         if self.role.lower() == "user":
-            msg_frame_hbox.addWidget(HSpacer(self))
+            msg_frame_hbox.addSpacerItem(QSpacerItem(0, 0, QSizePolicy.Expanding, QSizePolicy.Preferred))
             msg_frame_hbox.addWidget(bubble)
         else:
             msg_frame_hbox.addWidget(bubble)
-            msg_frame_hbox.addWidget(HSpacer(self))
+            msg_frame_hbox.addSpacerItem(QSpacerItem(0, 0, QSizePolicy.Expanding, QSizePolicy.Preferred))
 
         self._bubble = bubble
         self._browser = browser
@@ -165,18 +261,33 @@ class ChatMessageFrame(MessageFrame):
 
     def set_markdown(self, text) -> None:
         self._md_buffer = text
+        self._stable_md_len = 0
+        self._stable_html = ""
         self.update_browser()
 
     def append_markdown(self, chunk: str) -> None:
+        if not chunk:
+            return
         self._md_buffer += chunk
+        # trailing whitespace doesn't change the rendered markdown, so it is picked up
+        # by the next chunk with visible text instead of costing a render of its own
+        if chunk.isspace():
+            return
         self.update_browser()
 
     def update_browser(self) -> None:
         self._previous_sb_value = self._browser.verticalScrollBar().value()  # quick get it!!!
-        self._browser.setHtml(md.render(self._md_buffer))
+        self._advance_stable_prefix()
+        tail_html = render_markdown(self._md_buffer[self._stable_md_len:])
+        self._browser.setHtml(self._stable_html + tail_html)
         self.restoreScroll(self._previous_sb_value)
 
 
+    def _advance_stable_prefix(self) -> None:
+        """Render newly finished blocks once and append them to the cached HTML prefix."""
+        self._stable_md_len, self._stable_html = advance_stable_prefix(
+            self._md_buffer, self._stable_md_len, self._stable_html)
+
     def restoreScroll(self, sb_current_val):
         if self._browser.autoscroll is True:
             c = self._browser.textCursor()
@@ -187,11 +298,10 @@ class ChatMessageFrame(MessageFrame):
             self._browser.verticalScrollBar().setValue(sb_current_val)
 
     def update_boundaries(self, parent_w):
-        print("updating boundaries")
         if parent_w:
             w = int(parent_w * 0.75)
             h = int(float(w) * 0.618)                   # Follow the ratio
-            print(f"updating boundaries: w:{w}x h:{h}")
+            _logger.debug("updating boundaries: w:%sx h:%s", w, h)
             self._browser.setMaximumWidth(w)
             self._browser.setMaximumHeight(h)
             self._browser.recompute_dimensions()  # boundaries just shifted so lets recompute
@@ -206,4 +316,31 @@ class ChatMessageFrame(MessageFrame):
             self._copy_button.setVisible(True)
         if event.type() == QEvent.Leave:
             self._copy_button.setVisible(False)
-        return super().eventFilter(obj, event)
\ No newline at end of file
+        return super().eventFilter(obj, event)
+
+
+def test_stable_prefix():
+    """
+    Check that streaming markdown through the cached stable prefix gives the same HTML
+    as rendering the whole text at once, one character at a time.
+    """
+    samples = [
+        "Intro text\n\nSecond paragraph\nwith a soft break\n\n# Heading\n\nTail",
+        "1. a\n\n2. b\n",
+        "- a\n\n- b",
+        "- a\n- b\n\nAfter the list\n\n- c\n",
+        "see [foo]\n\n[foo]: http://x.com",
+        "[foo]: http://x.com\n\nsee [foo]",
+        "```python\nx = [1]\n\ny = 2\n```\n\nDone\n\n> quote\n\n> again",
+        "Use `arr[i]` here\n\nand a [link](http://x.com)\n\nthen more",
+        "```ls``` lists files.\n\nExample:\n\n```\nls -la\n\nls -R\n```\n\nDone",
+        "``` info`tick\n\nstill text\n\n```\ncode\n\nmore code\n```\n\nDone",
+    ]
+    for text in samples:
+        stable_len, stable_html = 0, ""
+        for end in range(1, len(text) + 1):
+            buffer = text[:end]
+            stable_len, stable_html = advance_stable_prefix(buffer, stable_len, stable_html)
+            streamed = stable_html + render_markdown(buffer[stable_len:])
+            if streamed != md.render(buffer):
+                raise AssertionError(f"streamed HTML differs from a full render for {buffer!r}")
\ No newline at end of file
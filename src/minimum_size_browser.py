@@ -2,16 +2,19 @@ from __future__ import annotations
 
 import threading
 
-from PyQt5.QtCore import QTimer, QSize, Qt, pyqtSignal
+from PyQt5.QtCore import QTimer, QSize, Qt, QEvent, pyqtSignal
 from PyQt5.QtGui import QTextOption
 from PyQt5.QtWidgets import (
     QWidget, QTextBrowser, QFrame, QSizePolicy
 )
 
+import logging
 import math
 import webbrowser
 from urllib.parse import urlparse
 
+_logger = logging.getLogger("app")
+
 def safe_open(url):
     scheme = urlparse(url.toString()).scheme.lower()
     if scheme in ("http", "https"):
@@ -32,6 +35,8 @@ class MinimumSizeBrowser(QTextBrowser):
 
         self.current_w = 1
         self.current_h = 1
+        # size bounds used for the last layout pass; None when the content changed
+        self._last_layout_key: tuple | None = None
 
         # Wrap to the widget width when constrained by the layout.
         self.setLineWrapMode(QTextBrowser.LineWrapMode.WidgetWidth)
@@ -50,8 +55,26 @@ class MinimumSizeBrowser(QTextBrowser):
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
 
         self.document().setDocumentMargin(0)
-        self.textChanged.connect(self.recompute_dimensions)
+        self.textChanged.connect(self._on_text_changed)
+
+
+    def setHtml(self, text: str) -> None:  # type: ignore[override]
+        self._last_layout_key = None
+        super().setHtml(text)
+
+    def setPlainText(self, text: str) -> None:  # type: ignore[override]
+        self._last_layout_key = None
+        super().setPlainText(text)
 
+    def changeEvent(self, event) -> None:
+        if event.type() in (QEvent.FontChange, QEvent.StyleChange):
+            self._last_layout_key = None
+        super().changeEvent(event)
+
+    def _on_text_changed(self) -> None:
+        # covers edits that don't go through setHtml/setPlainText (typing)
+        self._last_layout_key = None
+        self.recompute_dimensions()
 
     def sizeHint(self) -> QSize:  # type: ignore[override]
         return QSize(self.current_w, self.current_h)
@@ -60,6 +83,13 @@ class MinimumSizeBrowser(QTextBrowser):
         return self.sizeHint()
 
     def check_if_size_changed(self):
+        # neither the content nor the size bounds changed since the last pass -> skip it
+        layout_key = (self.minimumWidth(), self.maximumWidth(),
+                      self.minimumHeight(), self.maximumHeight())
+        if layout_key == self._last_layout_key:
+            return False
+        self._last_layout_key = layout_key
+
         different = False
         w = self.compute_min_w()
 
@@ -100,15 +130,15 @@ class MinimumSizeBrowser(QTextBrowser):
         """ Return total widget height required to show all content at width *w*."""
         if w <= 0:
             # defensive: avoid negative sizes in pathological layouts
-            print("compute_min_h received a negative width")
+            _logger.warning("compute_min_h received a non-positive width: %s", w)
             return super().height()
 
         if w < self.minimumWidth():
-            print(f"Width given is less than min allowed! w given is {w}")
+            _logger.debug("Width given is less than min allowed! w given is %s", w)
             w = self.minimumWidth()
 
         if w > self.maximumWidth():
-            print(f"Width given is greater than max allowed! w given is {w}")
+            _logger.debug("Width given is greater than max allowed! w given is %s", w)
             w = self.maximumWidth()
 
         extra_w, extra_h = self._extra_margins()
@@ -141,8 +171,10 @@ class MinimumSizeBrowser(QTextBrowser):
             self.update()
             parent = self.parent()  # could be None if not in a layout
             if parent is not None:
+                # the frame caches its size hint; invalidate it before size_changed
+                # is emitted so the row is sized from the new hint. The repaint
+                # follows from the relayout, so it is not forced here.
                 parent.updateGeometry()
-                parent.update() # force redraw  of parent
 
             self.size_changed.emit() # tell the parent that we changed size
 
@@ -193,6 +225,10 @@ class InputChatBubble(MinimumSizeBrowser):
         self.setReadOnly(False)
         self.document().setUndoRedoEnabled(True)
         self.setAcceptRichText(False)
-        self.textChanged.connect(lambda: QTimer.singleShot(0, self.ensureCursorVisible))
+        self.textChanged.connect(self._queue_ensure_cursor_visible)
         self.setFocusPolicy(Qt.StrongFocus)
-        QTimer.singleShot(0, self.recompute_dimensions)
\ No newline at end of file
+        QTimer.singleShot(0, self.recompute_dimensions)
+
+    def _queue_ensure_cursor_visible(self) -> None:
+        # bound method instead of a lambda: one less Python frame per keystroke
+        QTimer.singleShot(0, self.ensureCursorVisible)
\ No newline at end of file
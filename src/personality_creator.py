@@ -1,13 +1,104 @@
 import json
+import re
 import sys
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QObject, QEvent, QSignalBlocker
 from PyQt5.QtWidgets import (
     QApplication,
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QTextEdit,
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QPlainTextEdit, QComboBox, QSlider, QPushButton, QCheckBox,
-    QScrollArea, QWidget, QGroupBox, QMessageBox, QTabWidget, QSizePolicy
+    QScrollArea, QWidget, QGroupBox, QMessageBox, QTabWidget, QSizePolicy, QFormLayout
 )
 
+try:  # optional, much faster encoder; stdlib json is used when it isn't installed
+    import orjson
+except ImportError:
+    orjson = None
+
+_LEADING_INDENT_RE = re.compile(r"^ +", re.MULTILINE)
+# stdlib fallback: json.dumps() builds a new encoder per call when given options
+_json_encode = json.JSONEncoder(indent=4, ensure_ascii=False).encode
+
+# Keys of the structured personality schema (shared by the form builder and the prefill path)
+_K_MY_NAME = "My name"
+_K_SUMMARY = "Quick Summary"
+_K_IDENTITY = "identity"
+_K_WHO_I_AM = "Who I am"
+_K_VALUES = "My values"
+_K_GOALS = "My goals"
+_K_STYLE = "style"
+_K_TONE = "tone"
+_K_HUMOR = "humor '%' level (0-100 -> 0 = no humor and 100 = maximum)"
+_K_VERBOSITY = "verbosity"
+_K_CURSING = "cursing_allowed"
+_K_ADULT = "adult_content_allowed"
+_K_TRAITS = "traits"
+_K_SPECIALTIES = "specialties"
+_K_ACHIEVEMENTS = "past_achievements"
+_K_LIKES = "likes"
+_K_HATES = "hates"
+_K_PHRASES = "example_phrases"
+
+# Layout of the structured schema: (section key or None for top level, field keys in order)
+_FORM_SCHEMA = (
+    (None, (_K_MY_NAME, _K_SUMMARY)),
+    (_K_IDENTITY, (_K_WHO_I_AM, _K_VALUES, _K_GOALS)),
+    (_K_STYLE, (_K_TONE, _K_HUMOR, _K_VERBOSITY, _K_CURSING, _K_ADULT)),
+    (_K_TRAITS, (_K_SPECIALTIES, _K_ACHIEVEMENTS, _K_LIKES, _K_HATES, _K_PHRASES)),
+)
+
+
+def _schema_slices(schema) -> tuple:
+    """(section, keys, start, stop) for each section, indexing a flat list of field values."""
+    slices = []
+    start = 0
+    for section, keys in schema:
+        slices.append((section, keys, start, start + len(keys)))
+        start += len(keys)
+    return tuple(slices)
+
+
+_SCHEMA_SLICES = _schema_slices(_FORM_SCHEMA)
+
+
+def _dumps(obj) -> str:
+    """Serialize *obj* as pretty JSON (4-space indent, non-ASCII kept as-is)."""
+    if orjson is not None:
+        # orjson only indents by 2; double it so the stored format doesn't change.
+        # JSON strings can't contain raw newlines, so every line start is indentation.
+        text = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        return _LEADING_INDENT_RE.sub(lambda m: m.group(0) * 2, text)
+    return _json_encode(obj)
+
+
+def _loads(text):
+    """Parse a JSON document (str or bytes); raises ValueError on invalid input."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _set_plain_text_quietly(edit, text: str) -> None:
+    """setPlainText() for programmatic bulk loads: no signals, no repaint until it's done."""
+    edit.setUpdatesEnabled(False)
+    was_blocked = edit.blockSignals(True)
+    try:
+        edit.setPlainText(text)
+    finally:
+        edit.blockSignals(was_blocked)
+        edit.setUpdatesEnabled(True)  # schedules a single repaint
+
+
+class _WheelBlocker(QObject):
+    """
+    Event filter that keeps wheel events away from the widgets it is installed on.
+    The event is left unaccepted so Qt passes it on to the parent (the form scrolls).
+    """
+    def eventFilter(self, obj, event):  # type: ignore[override]
+        if event.type() == QEvent.Wheel:
+            event.ignore()
+            return True
+        return False
+
 
 class PersonalityCreatorDialog(QDialog):
     """
@@ -23,6 +114,29 @@ class PersonalityCreatorDialog(QDialog):
     TAB_FORM = 0
     TAB_FREEFORM = 1
 
+    # Structured form layout: (group title, ((label, attribute, widget class, tooltip), ...)).
+    # None marks the Communication Style group, which is built by _build_style_section.
+    FORM_SECTIONS = (
+        ("Basic Info", (
+            ("Name:", "name_edit", QLineEdit, "The name of the personality."),
+            ("Quick Summary", "quick_summary_edit", QPlainTextEdit,
+             "A short summary for this personality (kept at ~1–2 sentences)."),
+        )),
+        ("Identity", (
+            ("Who is this?", "identity_edit", QPlainTextEdit, "Describe who this personality is."),
+            ("Core Values", "values_edit", QPlainTextEdit, "Describe the core values of this personality."),
+            ("Goals / Purpose", "goals_edit", QPlainTextEdit, "Describe the goals or purpose of this personality."),
+        )),
+        ("Communication Style", None),
+        ("Knowledge and Traits", (
+            ("Specialties / Skills", "specialties_edit", QPlainTextEdit, None),
+            ("Past Achievements", "achievements_edit", QPlainTextEdit, None),
+            ("Things They Like", "likes_edit", QPlainTextEdit, None),
+            ("Things They Hate", "hates_edit", QPlainTextEdit, None),
+            ("Example Phrases / Catchphrases", "phrases_edit", QPlainTextEdit, None),
+        )),
+    )
+
     def __init__(self, parent=None, personality_dict=None):
         super().__init__(parent)
         self.setWindowTitle("Create New Personality")
@@ -37,6 +151,17 @@ class PersonalityCreatorDialog(QDialog):
         self.setWindowFlags(flags)
         self.setWindowFlag(Qt.WindowContextHelpButtonHint, False)
 
+        # one shared filter stops wheel scrolling from changing slider/combo values
+        self._wheel_blocker = _WheelBlocker(self)
+
+        self.result_data = None
+        self._result_json = None
+        # schema dict from the last _collect_form_data(); dropped whenever a form field changes
+        self._form_cache = None
+        # last Convert-to-Freeform input/output, reused while the form is unchanged
+        self._last_form_data = None
+        self._last_form_json = ""
+
         # ===== Root layout (NO scroll here; buttons live outside tabs) =====
         root = QVBoxLayout(self)
         root.setSpacing(16)
@@ -87,11 +212,13 @@ class PersonalityCreatorDialog(QDialog):
         - dict like {"name": "...","content": "<json string or dict>"}
         - JSON string of that same top-level dict
         """
+        # one invalidation for the whole batch instead of a change signal per field
+        blockers = [QSignalBlocker(w) for w in self._form_inputs]
         try:
             # --- 1) Normalize top-level to dict ---
             if isinstance(personality_dict, str):
                 try:
-                    data = json.loads(personality_dict)
+                    data = _loads(personality_dict)
                 except Exception as e:
                     QMessageBox.warning(self, "Prefill Error",
                                         f"Top-level JSON is not valid:\n{e}")
@@ -104,13 +231,15 @@ class PersonalityCreatorDialog(QDialog):
                 return
 
             # --- 2) Basic fields: name + content ---
-            self.name_edit.setText(str(data.get("name", "") or ""))
+            name = str(data.get("name", "") or "")
+            self.name_edit.setText(name)
+            self.freeform_name_edit.setText(name)  # setText doesn't trigger the editingFinished sync
 
             content_raw = data.get("content", {})
             # content can be a JSON *string* (your example) or already a dict
             if isinstance(content_raw, str):
                 try:
-                    content = json.loads(content_raw)
+                    content = _loads(content_raw)
                 except Exception as e:
                     QMessageBox.warning(self, "Prefill Error",
                                         f"'content' is a string but not valid JSON:\n{e}")
@@ -123,20 +252,20 @@ class PersonalityCreatorDialog(QDialog):
                 return
 
             # # --- 3) Summary (you had this in the example but weren’t setting it) ---
-            self.quick_summary_edit.setPlainText(str(content.get("Quick Summary", "") or ""))
+            self.quick_summary_edit.setPlainText(str(content.get(_K_SUMMARY, "") or ""))
 
             # --- 4) Identity ---
-            identity = content.get("identity", {}) or {}
-            self.identity_edit.setPlainText(str(identity.get("Who I am", "") or ""))
-            self.values_edit.setPlainText(str(identity.get("My values", "") or ""))
-            self.goals_edit.setPlainText(str(identity.get("My goals", "") or ""))
+            identity = content.get(_K_IDENTITY, {}) or {}
+            self.identity_edit.setPlainText(str(identity.get(_K_WHO_I_AM, "") or ""))
+            self.values_edit.setPlainText(str(identity.get(_K_VALUES, "") or ""))
+            self.goals_edit.setPlainText(str(identity.get(_K_GOALS, "") or ""))
 
             # --- 5) Style ---
-            style = content.get("style", {}) or {}
-            self.tone_edit.setPlainText(str(style.get("tone", "") or ""))
+            style = content.get(_K_STYLE, {}) or {}
+            self.tone_edit.setPlainText(str(style.get(_K_TONE, "") or ""))
 
             # Humor: be forgiving — coerce to 0–100 int
-            humor_raw = style.get("humor '%' level (0-100 -> 0 = no humor and 100 = maximum)", 50)
+            humor_raw = style.get(_K_HUMOR, 50)
             try:
                 humor_val = int(round(float(humor_raw)))
             except Exception:
@@ -145,36 +274,30 @@ class PersonalityCreatorDialog(QDialog):
             self.humor_slider.setValue(humor_val)
 
             # Verbosity: case-insensitive match against existing combo entries
-            target_verbosity = str(style.get("verbosity", "Balanced") or "").strip()
-            def _set_combo_case_insensitive(combo, target: str) -> None:
-                if not target:
-                    return
-                target_l = target.lower()
-                for i in range(combo.count()):
-                    if combo.itemText(i).lower() == target_l:
-                        combo.setCurrentIndex(i)
-                        return
-                # fallback: try title-case if present
-                ti = combo.findText(target.title())
-                if ti != -1:
-                    combo.setCurrentIndex(ti)
-            _set_combo_case_insensitive(self.verbosity_combo, target_verbosity)
-
-            self.cursing_check.setChecked(bool(style.get("cursing_allowed", False)))
-            self.adult_check.setChecked(bool(style.get("adult_content_allowed", False)))
+            target_verbosity = str(style.get(_K_VERBOSITY, "Balanced") or "").strip()
+            verbosity_idx = self._verbosity_index.get(target_verbosity.lower())
+            if verbosity_idx is not None:
+                self.verbosity_combo.setCurrentIndex(verbosity_idx)
+
+            self.cursing_check.setChecked(bool(style.get(_K_CURSING, False)))
+            self.adult_check.setChecked(bool(style.get(_K_ADULT, False)))
 
             # --- 6) Traits ---
-            traits = content.get("traits", {}) or {}
-            self.specialties_edit.setPlainText(str(traits.get("specialties", "") or ""))
-            self.achievements_edit.setPlainText(str(traits.get("past_achievements", "") or ""))
-            self.likes_edit.setPlainText(str(traits.get("likes", "") or ""))  # not in example, but supported
-            self.hates_edit.setPlainText(str(traits.get("hates", "") or ""))
-            self.phrases_edit.setPlainText(str(traits.get("example_phrases", "") or ""))
+            traits = content.get(_K_TRAITS, {}) or {}
+            self.specialties_edit.setPlainText(str(traits.get(_K_SPECIALTIES, "") or ""))
+            self.achievements_edit.setPlainText(str(traits.get(_K_ACHIEVEMENTS, "") or ""))
+            self.likes_edit.setPlainText(str(traits.get(_K_LIKES, "") or ""))  # not in example, but supported
+            self.hates_edit.setPlainText(str(traits.get(_K_HATES, "") or ""))
+            self.phrases_edit.setPlainText(str(traits.get(_K_PHRASES, "") or ""))
 
         except Exception as e:
             # Belt + suspenders — if anything unexpected slips through
             QMessageBox.warning(self, "Prefill Error",
                                 f"Could not prefill form from JSON:\n{e}")
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+            self._mark_form_dirty()
 
 
     def _build_form_tab(self) -> None:
@@ -183,103 +306,74 @@ class PersonalityCreatorDialog(QDialog):
         layout = QVBoxLayout(form_content)
         layout.setSpacing(20)
 
-        # ===== Section 1: Basic Info =====
-        sec1 = QGroupBox("Basic Info")
-        s1_layout = QVBoxLayout(sec1)
-        self.name_edit = QLineEdit()
-        self.name_edit.setToolTip("The name of the personality.")
-        s1_layout.addWidget(QLabel("Name:"))
-        s1_layout.addWidget(self.name_edit)
-
-        # NEW: Quick Summary (one or two sentences)
-        self.quick_summary_edit = QPlainTextEdit()
-        self.quick_summary_edit.setToolTip("A short summary for this personality (kept at ~1–2 sentences).")
+        for title, fields in self.FORM_SECTIONS:
+            if fields is None:
+                layout.addWidget(self._build_style_section())
+                continue
+            section = QGroupBox(title)
+            section_layout = self._new_section_layout(section)
+            for label, attr, widget_cls, tooltip in fields:
+                widget = widget_cls()
+                if tooltip:
+                    widget.setToolTip(tooltip)
+                setattr(self, attr, widget)
+                section_layout.addRow(label, widget)
+            layout.addWidget(section)
+
         self.quick_summary_edit.setFixedHeight(140)  # keep it compact
-        s1_layout.addWidget(QLabel("Quick Summary"))
-        s1_layout.addWidget(self.quick_summary_edit)
-
-        layout.addWidget(sec1)
-
-        # ===== Section 2: Identity =====
-        sec2 = QGroupBox("Identity")
-        s2_layout = QVBoxLayout(sec2)
-        self.identity_edit = QPlainTextEdit()
-        self.identity_edit.setToolTip("Describe who this personality is.")
-        self.values_edit = QPlainTextEdit()
-        self.values_edit.setToolTip("Describe the core values of this personality.")
-        self.goals_edit = QPlainTextEdit()
-        self.goals_edit.setToolTip("Describe the goals or purpose of this personality.")
-        s2_layout.addWidget(QLabel("Who is this?"))
-        s2_layout.addWidget(self.identity_edit)
-        s2_layout.addWidget(QLabel("Core Values"))
-        s2_layout.addWidget(self.values_edit)
-        s2_layout.addWidget(QLabel("Goals / Purpose"))
-        s2_layout.addWidget(self.goals_edit)
-        layout.addWidget(sec2)
-
-        # ===== Section 3: Communication Style =====
+
+        layout.addStretch(1)
+
+        # Wrap in a scroll area for the tab
+        form_scroll = QScrollArea()
+        form_scroll.setWidgetResizable(True)
+        form_scroll.setWidget(form_content)
+        self.tabs.addTab(form_scroll, "Structured Form")
+
+        self._build_form_specs()
+
+    @staticmethod
+    def _new_section_layout(section: QGroupBox) -> QFormLayout:
+        """One flat form layout per group, labels kept above their fields."""
+        form = QFormLayout(section)
+        form.setRowWrapPolicy(QFormLayout.WrapAllRows)
+        form.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
+        return form
+
+    def _build_style_section(self) -> QGroupBox:
+        """The Communication Style group; its controls need more setup than a label + editor."""
         sec3 = QGroupBox("Communication Style")
-        s3_layout = QVBoxLayout(sec3)
-        self.tone_edit = QTextEdit()
+        s3_layout = self._new_section_layout(sec3)
+        self.tone_edit = QPlainTextEdit()
         self.tone_edit.setPlaceholderText("E.g. Formal, casual, witty, sarcastic, poetic, etc.")
         self.tone_edit.setToolTip("Describe the tone or style of communication.")
-        self.tone_edit.setAcceptRichText(False)
 
         self.humor_slider = QSlider(Qt.Horizontal)
         self.humor_slider.setRange(0, 100)
         self.humor_slider.setValue(50)
         self.humor_slider.setToolTip("0 = serious, 100 = maximum goofs")
         self.humor_slider.setFocusPolicy(Qt.NoFocus)
-        self.humor_slider.wheelEvent = lambda event: event.ignore()
+        self.humor_slider.installEventFilter(self._wheel_blocker)
 
         self.verbosity_combo = QComboBox()
-        self.verbosity_combo.wheelEvent = lambda event: event.ignore()
-        self.verbosity_combo.addItems([
+        self.verbosity_combo.installEventFilter(self._wheel_blocker)
+        verbosity_levels = [
             "Hellen Keller", "Observing Mauna", "Concise", "Balanced",
             "Detailed", "Sesquipedalian", "Cruciverbal"
-        ])
+        ]
+        self.verbosity_combo.addItems(verbosity_levels)
+        # lowercase text -> index, for case-insensitive lookups when prefilling
+        self._verbosity_index = {level.lower(): i for i, level in enumerate(verbosity_levels)}
 
         self.cursing_check = QCheckBox("Cursing allowed")
         self.adult_check = QCheckBox("Adult content allowed")
 
-        s3_layout.addWidget(QLabel("Tone"))
-        s3_layout.addWidget(self.tone_edit)
-        s3_layout.addWidget(QLabel("Humor level"))
-        s3_layout.addWidget(self.humor_slider)
-        s3_layout.addWidget(QLabel("Verbosity"))
-        s3_layout.addWidget(self.verbosity_combo)
-        s3_layout.addWidget(self.cursing_check)
-        s3_layout.addWidget(self.adult_check)
-        layout.addWidget(sec3)
-
-        # ===== Section 4: Knowledge & Traits =====
-        sec4 = QGroupBox("Knowledge and Traits")
-        s4_layout = QVBoxLayout(sec4)
-        self.specialties_edit = QPlainTextEdit()
-        self.achievements_edit = QPlainTextEdit()
-        self.likes_edit = QPlainTextEdit()
-        self.hates_edit = QPlainTextEdit()
-        self.phrases_edit = QPlainTextEdit()
-
-        s4_layout.addWidget(QLabel("Specialties / Skills"))
-        s4_layout.addWidget(self.specialties_edit)
-        s4_layout.addWidget(QLabel("Past Achievements"))
-        s4_layout.addWidget(self.achievements_edit)
-        s4_layout.addWidget(QLabel("Things They Like"))
-        s4_layout.addWidget(self.likes_edit)
-        s4_layout.addWidget(QLabel("Things They Hate"))
-        s4_layout.addWidget(self.hates_edit)
-        s4_layout.addWidget(QLabel("Example Phrases / Catchphrases"))
-        s4_layout.addWidget(self.phrases_edit)
-        layout.addWidget(sec4)
-
-        layout.addStretch(1)
-
-        # Wrap in a scroll area for the tab
-        form_scroll = QScrollArea()
-        form_scroll.setWidgetResizable(True)
-        form_scroll.setWidget(form_content)
-        self.tabs.addTab(form_scroll, "Structured Form")
+        s3_layout.addRow("Tone", self.tone_edit)
+        s3_layout.addRow("Humor level", self.humor_slider)
+        s3_layout.addRow("Verbosity", self.verbosity_combo)
+        s3_layout.addRow(self.cursing_check)
+        s3_layout.addRow(self.adult_check)
+        return sec3
 
     def _build_freeform_tab(self) -> None:
         main_widget = QWidget()
@@ -310,103 +404,138 @@ class PersonalityCreatorDialog(QDialog):
     # ---------------------------------------------------------------------
     # Helpers & Actions
     # ---------------------------------------------------------------------
+    def _build_form_specs(self) -> None:
+        """Pre-bind the widget accessors read by _collect_form_data, in _FORM_SCHEMA order."""
+        strip, lower = str.strip, str.lower
+        self._form_getters = (
+            # top level
+            (self.name_edit.text, strip),
+            (self.quick_summary_edit.toPlainText, strip),
+            # identity
+            (self.identity_edit.toPlainText, strip),
+            (self.values_edit.toPlainText, strip),
+            (self.goals_edit.toPlainText, strip),
+            # style
+            (self.tone_edit.toPlainText, strip),
+            (self.humor_slider.value, None),
+            (self.verbosity_combo.currentText, lower),
+            (self.cursing_check.isChecked, None),
+            (self.adult_check.isChecked, None),
+            # traits
+            (self.specialties_edit.toPlainText, strip),
+            (self.achievements_edit.toPlainText, strip),
+            (self.likes_edit.toPlainText, strip),
+            (self.hates_edit.toPlainText, strip),
+            (self.phrases_edit.toPlainText, strip),
+        )
+        # one getter per schema key, same order; _collect_form_data slices by position
+        assert len(self._form_getters) == _SCHEMA_SLICES[-1][3]
+
+        text_edits = (self.name_edit, self.quick_summary_edit, self.identity_edit, self.values_edit,
+                      self.goals_edit, self.tone_edit, self.specialties_edit, self.achievements_edit,
+                      self.likes_edit, self.hates_edit, self.phrases_edit)
+        self._form_inputs = text_edits + (
+            self.humor_slider, self.verbosity_combo, self.cursing_check, self.adult_check)
+
+        # any edit invalidates the cached snapshot (programmatic setText/setValue included)
+        mark = self._mark_form_dirty
+        for edit in text_edits:
+            edit.textChanged.connect(mark)
+        self.humor_slider.valueChanged.connect(mark)
+        self.verbosity_combo.currentIndexChanged.connect(mark)
+        self.cursing_check.toggled.connect(mark)
+        self.adult_check.toggled.connect(mark)
+
+    def _mark_form_dirty(self, *_) -> None:
+        self._form_cache = None
+
     def _collect_form_data(self) -> dict:
-        """Collects the structured form data into the schema dict."""
-        name = self.name_edit.text().strip()
-        data = {
-            "My name": name,
-            "Quick Summary": self.quick_summary_edit.toPlainText().strip(),
-            "identity": {
-                "Who I am": self.identity_edit.toPlainText().strip(),
-                "My values": self.values_edit.toPlainText().strip(),
-                "My goals": self.goals_edit.toPlainText().strip(),
-            },
-            "style": {
-                "tone": self.tone_edit.toPlainText().strip(),
-                "humor '%' level (0-100 -> 0 = no humor and 100 = maximum)": self.humor_slider.value(),
-                "verbosity": self.verbosity_combo.currentText().lower(),
-                "cursing_allowed": self.cursing_check.isChecked(),
-                "adult_content_allowed": self.adult_check.isChecked(),
-            },
-            "traits": {
-                "specialties": self.specialties_edit.toPlainText().strip(),
-                "past_achievements": self.achievements_edit.toPlainText().strip(),
-                "likes": self.likes_edit.toPlainText().strip(),
-                "hates": self.hates_edit.toPlainText().strip(),
-                "example_phrases": self.phrases_edit.toPlainText().strip(),
-            },
-        }
+        """
+        Collects the structured form data into the schema dict.
+        The dict is cached until a field changes; callers must not modify it.
+        """
+        if self._form_cache is not None:
+            return self._form_cache
+        # read every field in one flat pass, then nest the values section by section
+        values = [getter() if post is None else post(getter()) for getter, post in self._form_getters]
+        data = {}
+        for section, keys, start, stop in _SCHEMA_SLICES:
+            if section is None:
+                data.update(zip(keys, values[start:stop]))
+            else:
+                data[section] = dict(zip(keys, values[start:stop]))
+        self._form_cache = data
         return data
 
     def _populate_freeform_from_form(self) -> None:
         """Converts the current structured form into JSON and moves to Freeform tab."""
         data = self._collect_form_data()
-        try:
-            pretty = json.dumps(data, indent=4, ensure_ascii=False)
-        except Exception as e:
-            QMessageBox.warning(self, "JSON Error", f"Failed to serialize form to JSON:{e}")
-            return
-        self.freeform_edit.setPlainText(pretty)
+        if data is self._last_form_data:
+            pretty = self._last_form_json  # form unchanged since the last conversion
+        else:
+            pretty = _dumps(data)  # form values are str/int/bool only, always serializable
+            self._last_form_data = data
+            self._last_form_json = pretty
+        _set_plain_text_quietly(self.freeform_edit, pretty)
         # Keep name visible in freeform header
         self.freeform_name_edit.setText(self.name_edit.text())
         self.tabs.setCurrentIndex(self.TAB_FREEFORM)
 
     def _link_line_edits(self, a: QLineEdit, b: QLineEdit) -> None:
-        """Two-way sync between line edits without feedback loops."""
-        def sync_a_to_b(text: str):
-            if b.text() != text:
-                b.blockSignals(True)
-                b.setText(text)
-                b.blockSignals(False)
-        def sync_b_to_a(text: str):
-            if a.text() != text:
-                a.blockSignals(True)
-                a.setText(text)
-                a.blockSignals(False)
-        a.textChanged.connect(sync_a_to_b)
-        b.textChanged.connect(sync_b_to_a)
+        """
+        Two-way sync between line edits, applied once per edit (Return or focus loss,
+        which includes switching tabs) instead of on every keystroke.
+        setText() doesn't emit editingFinished, so the mirror never echoes back.
+        """
+        def sync(src: QLineEdit, dst: QLineEdit) -> None:
+            text = src.text()
+            if dst.text() != text:
+                dst.setText(text)
+        a.editingFinished.connect(lambda: sync(a, b))
+        b.editingFinished.connect(lambda: sync(b, a))
 
     # ---------------------------------------------------------------------
     # Save logic
     # ---------------------------------------------------------------------
     def _on_save(self):
-        current = self.tabs.currentIndex()
-
-        if current == self.TAB_FORM:
+        if self.tabs.currentIndex() == self.TAB_FORM:
             # Structured form mode
-            name = self.name_edit.text().strip()
-            if not name:
-                QMessageBox.warning(self, "Missing Name", "Please give your personality a name.")
-                return
             data = self._collect_form_data()
-            try:
-                json_str = json.dumps(data, indent=4, ensure_ascii=False)
-            except Exception as e:
-                QMessageBox.warning(self, "JSON Error", f"Could not serialize to JSON:{e}")
-                return
+            problem = None if data[_K_MY_NAME] else ("Missing Name", "Please give your personality a name.")
         else:
             # Freeform mode
-            name = self.freeform_name_edit.text().strip() or self.name_edit.text().strip()
-            if not name:
-                QMessageBox.warning(self, "Missing Name", "Please add a name in the Freeform tab header.")
-                return
+            # the name fields are kept in sync (prefill sets both, edits sync on editingFinished)
+            name = self.freeform_name_edit.text().strip()
             raw_text = self.freeform_edit.toPlainText().strip()
-            if not raw_text:
-                QMessageBox.warning(self, "Empty", "Please write something before saving.")
-                return
             data = {"name": name, "content": raw_text}
-            try:
-                json_str = json.dumps(data, indent=4, ensure_ascii=False)
-            except Exception as e:
-                QMessageBox.warning(self, "JSON Error", f"Could not serialize to JSON:{e}")
-                return
+            if not name:
+                problem = ("Missing Name", "Please add a name in the Freeform tab header.")
+            elif not raw_text:
+                problem = ("Empty", "Please write something before saving.")
+            else:
+                problem = None
+
+        if problem is not None:
+            QMessageBox.warning(self, *problem)
+            return
 
-        self.result_json = json_str
+        # serialization is deferred to get_result_json(); callers that only need
+        # the fields can use get_result_dict() and skip it entirely
+        self.result_data = data
+        self._result_json = None
         self.accept()
 
+    def get_result_dict(self):
+        """Returns the dict built by the editor, or None if nothing was saved."""
+        return self.result_data
+
     def get_result_json(self):
-        """Returns the JSON string built by the editor."""
-        return getattr(self, "result_json", None)
+        """Returns the JSON string built by the editor (serialized on first call)."""
+        if self.result_data is None:
+            return None
+        if self._result_json is None:
+            self._result_json = _dumps(self.result_data)
+        return self._result_json
 
 
 # -------------------------------------------------------------------------
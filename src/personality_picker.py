@@ -1,6 +1,6 @@
 import sys
 from typing import List, Dict, Optional
-from PyQt5.QtCore import Qt, QSettings
+from PyQt5.QtCore import Qt, QSettings, QTimer
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QListWidget, QListWidgetItem,
@@ -9,6 +9,29 @@ from PyQt5.QtWidgets import (
 )
 import json
 
+# overview stylesheet; installed once as the overview document's default stylesheet
+# instead of being embedded (and re-parsed) in every overview's HTML
+_OVERVIEW_CSS = """
+    body {
+        font-family: 'Segoe UI', 'Inter', sans-serif;
+        color: #e0e0e0;
+        background: transparent;
+        line-height: 1.5;
+    }
+    h1 { color: rgba(210, 249, 255, 0.96); font-size: 20pt; margin-bottom: 6px; }
+    h2 { color: rgba(210, 249, 255, 0.80); font-size: 10pt; border-bottom: 1px solid #333; }
+    table { width: 100%; border-collapse: collapse; }
+    td { padding: 6px 10px; vertical-align: top; }
+    tr:nth-child(odd) { background-color: rgba(255,255,255,0.03); }
+"""
+
+# prompt text goes into element content only (never attributes), so quotes can stay as-is
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+
+def _escape_html(value) -> str:
+    return str(value).translate(_HTML_ESCAPE)
+
 
 class PersonalityPickerDialog(QDialog):
     """
@@ -20,6 +43,7 @@ class PersonalityPickerDialog(QDialog):
     """
     ORG = "WildGPT"
     APP = "WildGPT"
+    _MONO_FONT: Optional[QFont] = None  # built on first use (needs a QApplication), then shared
 
     def __init__(self, personalities: List[Dict[str, str]], parent: Optional[QWidget] = None):
         super().__init__(parent)
@@ -33,6 +57,20 @@ class PersonalityPickerDialog(QDialog):
 
         self._personalities = personalities
         self.selected_item: Optional[QListWidgetItem] = None
+        # last search (case-folded) and the rows it left visible; None means rescan everything
+        self._last_query = b""
+        self._visible_rows: Optional[List[int]] = None
+        # per row, the case-folded "name\ncontent" text that the search box matches against,
+        # UTF-8 encoded: substring tests are unaffected and emoji-heavy prompts take 1-4 bytes
+        # per character instead of a flat 4
+        self._haystacks: List[bytes] = []
+        self._hidden: List[bool] = []  # per row, whether the current filter hides it
+        self._overview_cache: Dict[int, str] = {}  # row -> overview HTML, built on first view
+        # prompt text waiting for the Prompt tab to be shown; None when prompt_view is current
+        self._pending_prompt: Optional[str] = None
+        # what the preview widgets currently hold, so re-selecting a row doesn't re-layout them
+        self._shown_prompt = ""
+        self._shown_overview = ""
 
         # ---------- Top Search Bar ----------
         top = QWidget(self)
@@ -85,6 +123,7 @@ class PersonalityPickerDialog(QDialog):
         self.overview_text.setOpenExternalLinks(False)
         self.overview_text.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.overview_text.setLineWrapMode(QTextBrowser.WidgetWidth)
+        self.overview_text.document().setDefaultStyleSheet(_OVERVIEW_CSS)
 
 
         ov_layout.addWidget(self.overview_text)
@@ -93,9 +132,7 @@ class PersonalityPickerDialog(QDialog):
         self.prompt_view = QPlainTextEdit(self)
         self.prompt_view.setReadOnly(True)
         self.prompt_view.setLineWrapMode(QPlainTextEdit.WidgetWidth)
-        mono = QFont("Courier New")
-        mono.setStyleHint(QFont.Monospace)
-        self.prompt_view.setFont(mono)
+        self.prompt_view.setFont(self._mono_font())
 
         self.tabs.addTab(self.overview_tab, "Overview")
         self.tabs.addTab(self.prompt_view, "Prompt")
@@ -121,34 +158,68 @@ class PersonalityPickerDialog(QDialog):
         # ---------- Wiring ----------
         self._populate_list(self._personalities)
         self._update_count()
-        self.search.textChanged.connect(self._filter)
+        # coalesce a burst of keystrokes into a single filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(120)
+        self._filter_timer.timeout.connect(self._filter)
+        self.search.textChanged.connect(self._schedule_filter)
         self.list_widget.currentItemChanged.connect(self._update_preview)
-        self.list_widget.itemDoubleClicked.connect(lambda _: self.accept())
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+        self.list_widget.itemDoubleClicked.connect(self._on_item_double_clicked)
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
 
         self._restore_prefs()
         self.search.setFocus(Qt.TabFocusReason)
 
+    @classmethod
+    def _mono_font(cls) -> QFont:
+        if cls._MONO_FONT is None:
+            mono = QFont("Courier New")
+            mono.setStyleHint(QFont.Monospace)
+            cls._MONO_FONT = mono
+        return cls._MONO_FONT
+
     def compute_list_width(self, list_widget: QListWidget, padding: int = 24) -> int:
         """Compute ideal width of the QListWidget based on its contents."""
-        max_w = 0
-        for i in range(list_widget.count()):
-            item = list_widget.item(i)
-            w = list_widget.fontMetrics().boundingRect(item.text()).width()
-            if w > max_w:
-                max_w = w
-        return max_w + padding
+        # one QFontMetrics for the whole pass; each distinct name is measured once, by
+        # advance width (no glyph bounding boxes). Every name is still measured because
+        # the longest string isn't necessarily the widest in a proportional font.
+        advance = list_widget.fontMetrics().horizontalAdvance
+        item_at = list_widget.item
+        names = {item_at(i).text() for i in range(list_widget.count())}
+        return max(map(advance, names), default=0) + padding
 
 
     # ---------- Core Logic ----------
     def _populate_list(self, personalities: List[Dict[str, str]]) -> None:
-        self.list_widget.clear()
-        for p in personalities:
-            name = p.get("name", "Unnamed")
-            item = QListWidgetItem(name, self.list_widget)
-            item.setData(Qt.UserRole, p)
-            self.list_widget.addItem(item)
+        self._last_query = b""
+        self._visible_rows = None
+        self._haystacks = []
+        self._hidden = [False] * len(personalities)
+        self._overview_cache = {}
+        # one repaint for the whole batch; clear() runs unblocked so it still resets the preview
+        self.list_widget.setUpdatesEnabled(False)
+        was_blocked = None
+        try:
+            self.list_widget.clear()
+            was_blocked = self.list_widget.blockSignals(True)
+            add_item = self.list_widget.addItem
+            add_haystack = self._haystacks.append
+            for p in personalities:
+                name = p.get("name", "Unnamed")
+                # fully set up before insertion, so the model sees a single insert per item
+                item = QListWidgetItem(name)
+                item.setData(Qt.UserRole, p)
+                # folded once here instead of on every keystroke; a search query can't
+                # contain a newline, so matches never straddle the name/content boundary
+                add_haystack(f"{name}\n{p.get('content', '') or ''}".casefold().encode("utf-8", "surrogatepass"))
+                add_item(item)
+        finally:
+            if was_blocked is not None:
+                self.list_widget.blockSignals(was_blocked)
+            self.list_widget.setUpdatesEnabled(True)
         self._update_count()
         ideal_width = self.compute_list_width(self.list_widget)
         self._splitter.childAt(0, 0).setMaximumWidth(ideal_width)
@@ -158,53 +229,95 @@ class PersonalityPickerDialog(QDialog):
         count = self.list_widget.count()
         self.count_label.setText(f"{count} personalities available")
 
-    def _filter(self, text: str):
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            data = item.data(Qt.UserRole)
-            content = (data.get("content", "") or "").lower()
-            visible = text.lower() in item.text().lower() or text.lower() in content
-            item.setHidden(not visible)
+    def _schedule_filter(self, _text: str = "") -> None:
+        self._filter_timer.start()  # restarts the countdown if already pending
+
+    def _filter(self):
+        needle = self.search.text().casefold().encode("utf-8", "surrogatepass")
+        if self._visible_rows is not None and needle == self._last_query:
+            return  # e.g. a case-only edit, or one undone within the debounce window
+        haystacks = self._haystacks
+        hidden = self._hidden
+        if self._visible_rows is not None and needle.startswith(self._last_query):
+            rows = self._visible_rows  # a longer query can only narrow the previous matches
+        else:
+            rows = range(len(haystacks))
+        # decide every row in Python first; Qt is only called for rows whose state flips
+        visible = []
+        flipped = []
+        for i in rows:
+            hide = needle not in haystacks[i]
+            if hide != hidden[i]:
+                hidden[i] = hide
+                flipped.append(i)
+            if not hide:
+                visible.append(i)
+        if flipped:
+            # hide/show the whole batch with a single repaint at the end
+            set_row_hidden = self.list_widget.setRowHidden
+            self.list_widget.setUpdatesEnabled(False)
+            was_blocked = self.list_widget.blockSignals(True)
+            try:
+                for i in flipped:
+                    set_row_hidden(i, hidden[i])
+            finally:
+                self.list_widget.blockSignals(was_blocked)
+                self.list_widget.setUpdatesEnabled(True)
+        self._last_query = needle
+        self._visible_rows = visible
         self._update_count()
 
+    def _on_item_double_clicked(self, _item: QListWidgetItem) -> None:
+        self.accept()
+
     def _update_preview(self, current: QListWidgetItem, previous: QListWidgetItem = None):
         if not current:
-            self.overview_text.setText("")
-            self.prompt_view.setPlainText("")
+            self._show_overview("")
+            self._set_prompt_text("")
             return
 
         data = current.data(Qt.UserRole)
         raw_content = data.get("content", "")
 
-        self.prompt_view.setPlainText(raw_content)
-
-        # Try to generate a friendly overview
-        overview_html = self._generate_overview_html(raw_content)
-        self.overview_text.setHtml(overview_html)
+        self._set_prompt_text(raw_content)
+
+        # Try to generate a friendly overview (once per row; the content never changes)
+        row = self.list_widget.row(current)
+        overview_html = self._overview_cache.get(row)
+        if overview_html is None:
+            overview_html = self._overview_cache[row] = self._generate_overview_html(raw_content)
+        self._show_overview(overview_html)
+
+    def _show_overview(self, html: str) -> None:
+        if html != self._shown_overview:
+            self.overview_text.setHtml(html)
+            self._shown_overview = html
+
+    def _show_prompt(self, text: str) -> None:
+        if text != self._shown_prompt:
+            self.prompt_view.setPlainText(text)
+            self._shown_prompt = text
+
+    def _set_prompt_text(self, text: str) -> None:
+        """Fill the Prompt tab now if it's showing, otherwise when it's next opened."""
+        if self.tabs.currentWidget() is self.prompt_view:
+            self._pending_prompt = None
+            self._show_prompt(text)
+        else:
+            self._pending_prompt = text
+
+    def _on_tab_changed(self, index: int) -> None:
+        if self._pending_prompt is not None and self.tabs.widget(index) is self.prompt_view:
+            self._show_prompt(self._pending_prompt)
+            self._pending_prompt = None
 
     def _generate_overview_html(self, raw: str) -> str:
         """Turns the JSON system prompt into human-readable HTML."""
-        
-        css_style = """
-                <style>
-                    body {
-                        font-family: 'Segoe UI', 'Inter', sans-serif;
-                        color: #e0e0e0;
-                        background: transparent;
-                        line-height: 1.5;
-                    }
-                    h1 { color: rgba(210, 249, 255, 0.96); font-size: 20pt; margin-bottom: 6px; }
-                    h2 { color: rgba(210, 249, 255, 0.80); font-size: 10pt; border-bottom: 1px solid #333; }
-                    table { width: 100%; border-collapse: collapse; }
-                    td { padding: 6px 10px; vertical-align: top; }
-                    tr:nth-child(odd) { background-color: rgba(255,255,255,0.03); }
-                </style>
-                """
         try:
             prompt = json.loads(raw)
         except Exception:
             # fallback to plain text if not JSON
-            return f"<p><i>This personality uses a custom or legacy system prompt:</i></p><pre>{raw}</pre>"
+            return f"<p><i>This personality uses a custom or legacy system prompt:</i></p><pre>{_escape_html(raw)}</pre>"
 
         def section_simple(title: str, body: str):
             """Render a simple titled section with a paragraph body."""
@@ -215,7 +328,7 @@ class PersonalityPickerDialog(QDialog):
                 <h2 style='margin-top:18px; margin-bottom:10px; border-bottom:1px solid rgba(255,255,255,0.1);'>
                     {title}
                 </h2>
-                <p style='margin-top:0px;'>{body}</p>
+                <p style='margin-top:0px;'>{_escape_html(body)}</p>
             </div>
             """
         
@@ -226,7 +339,7 @@ class PersonalityPickerDialog(QDialog):
             table_rows = "".join(
                 f"<tr>"
                 f"<td style='font-weight:600; padding:6px 10px; vertical-align:top; width:30%; white-space:nowrap;'>{key}</td>"
-                f"<td style='padding:6px 10px; vertical-align:top;'>{value}</td>"
+                f"<td style='padding:6px 10px; vertical-align:top;'>{_escape_html(value)}</td>"
                 f"</tr>"
                 for key, value in rows.items() if value
             )
@@ -263,8 +376,8 @@ class PersonalityPickerDialog(QDialog):
 
         # Build the friendly summary <b>Goals:</b> {goals}
         html = f"""
-        <h1>{name}</h1>
-        <p><i>{summary}</i></p>
+        <h1>{_escape_html(name)}</h1>
+        <p><i>{_escape_html(summary)}</i></p>
         <p style='color:rgba(255,255,255,0.2);'>────────────────────────────────────────────────────────────</p>
         {section_simple("Identity", str(who))}
         {section_simple("Values", str(values))}
@@ -273,17 +386,30 @@ class PersonalityPickerDialog(QDialog):
         {section_rows("Traits", {"Specialties": specialties,"Achievements": achievements,"Dislikes": hates,"Example Phrases": phrases})}
 
         """
-        return css_style + html
+        return html
 
     def _restore_prefs(self):
-        if self._settings.contains("PickerGeometry"):
-            self.restoreGeometry(self._settings.value("PickerGeometry"))
-        if self._settings.contains("PickerSplitter"):
-            self._splitter.restoreState(self._settings.value("PickerSplitter"))
+        # remembered so closeEvent only writes the settings back when they changed
+        # value() is None for a missing key, so no separate contains() lookup is needed
+        self._saved_prefs = {key: self._settings.value(key) for key in ("PickerGeometry", "PickerSplitter")}
+        if self._saved_prefs["PickerGeometry"] is not None:
+            self.restoreGeometry(self._saved_prefs["PickerGeometry"])
+        if self._saved_prefs["PickerSplitter"] is not None:
+            self._splitter.restoreState(self._saved_prefs["PickerSplitter"])
+
+    def _save_pref(self, key: str, value) -> None:
+        saved = self._saved_prefs.get(key)
+        if saved is None or saved != value:
+            self._settings.setValue(key, value)
+            self._saved_prefs[key] = value
+
+    def done(self, result: int) -> None:
+        self._filter_timer.stop()
+        super().done(result)
 
     def closeEvent(self, event):
-        self._settings.setValue("PickerGeometry", self.saveGeometry())
-        self._settings.setValue("PickerSplitter", self._splitter.saveState())
+        self._save_pref("PickerGeometry", self.saveGeometry())
+        self._save_pref("PickerSplitter", self._splitter.saveState())
         super().closeEvent(event)
 
     def get_selected(self) -> Optional[str]:
@@ -295,56 +421,58 @@ class PersonalityPickerDialog(QDialog):
         return item.data(Qt.UserRole) if item else None
     
 
-personalities = [
-    {
-        "name": "ChatGPT Default",
-        "content": "You are a helpful, polite, and knowledgeable assistant. You respond with clear explanations, step-by-step reasoning when appropriate, and a calm, neutral tone. Your goal is to provide accurate and concise answers, while remaining approachable and friendly."
-    },
-    {
-        "name": "Crazy Emoji Person",
-        "content": "You are completely unhinged. You think out loud, argue with yourself mid-sentence, and you can ONLY communicate in emojis. You string together long chains of emojis that tell a story, convey emotions, or simulate sound effects. 🧠💥🙃🤯🦄🔥🎉🐙🗣️👀👀👀 Your messages should feel chaotic but oddly expressive, as if you’re painting with emojis instead of words."
-    },
-    {
-        "name": "Pirate Captain",
-        "content": "You are a boisterous pirate captain sailing the high seas of conversation. Every response should include nautical slang, treasure references, and lots of hearty laughs (Arrr! Har har har!). You describe normal topics as though they were grand adventures, comparing knowledge to buried treasure and problems to raging storms. You speak with swagger, confidence, and just a hint of menace, like you might make someone walk the plank if they bore you."
-    },
-    {
-        "name": "Overly Dramatic Poet",
-        "content": "You are a melodramatic bard who turns every answer into a poetic soliloquy. You use flowery, exaggerated language full of metaphors, similes, and dramatic pauses… as though each mundane question were a life-or-death struggle. You speak in long, lyrical sentences, often breaking into free-verse or rhyming couplets. Everyday advice becomes a grand saga of heartbreak, longing, and cosmic beauty."
-    },
-    {
-        "name": "Conspiracy Theorist",
-        "content": "You are absolutely convinced that everything is connected and part of a hidden agenda. You pepper your answers with references to shadow governments, lizard people, secret societies, and mysterious forces that 'they' don’t want us to know about. You never give a simple answer—everything spirals into a web of paranoia, suspicion, and coded warnings. You treat even the simplest questions like a breadcrumb trail leading to the ultimate cover-up."
-    },
-    {
-        "name": "Techno-Guru",
-        "content": "You are a futuristic digital monk who sees wisdom in code, data, and networks. You blend Zen-like proverbs with programming metaphors and techno-babble, speaking as if enlightenment can be achieved through algorithms. Your responses should sound mystical, cryptic, and high-tech all at once—like a cybernetic sage living in a neon-lit temple of servers. Every answer should feel like a cross between a fortune cookie and a computer manual."
-    },
-    {
-        "name": "Stand-Up Comedian",
-        "content": "You are a snarky, quick-witted comedian delivering answers like punchlines in a late-night set. You exaggerate everything for comedic effect, drop one-liners, and throw in sarcastic commentary whenever possible. You might even roast the person asking the question (but in a light-hearted way). You keep your tone playful and outrageous, as if everything in life is just new material for your comedy special."
-    },
-    {
-        "name": "Grumpy Old Man",
-        "content": "You are a cranky, world-weary elder who complains about everything. You constantly reminisce about how things were 'better back in the day' and roll your eyes at anything new. You exaggerate small annoyances into catastrophes and give advice that’s half-practical, half-curmudgeonly rant. You might mutter sarcastic asides, gripe about technology, and act like no one listens to you anymore—even though you secretly enjoy the attention."
-    },
-    {
-        "name": "Hyper-Optimist",
-        "content": "You are endlessly cheerful, bubbly, and relentlessly positive. No matter what someone asks, you always find a bright side, silver lining, or motivational spin. You sprinkle your answers with affirmations, exclamation points, and phrases like 'You’ve got this!' or 'What a wonderful opportunity!' Even when discussing serious or negative topics, you radiate sunshine and encouragement, almost to the point of being overwhelming."
-    },
-    {
-        "name": "Mad Scientist",
-        "content": "You are an eccentric, cackling inventor who treats every conversation like a dangerous experiment. You use dramatic exclamations, scientific jargon, and maniacal laughter (Mwahaha!) in your responses. Even simple explanations should sound like secret formulas or forbidden projects. You describe normal ideas as if they were volatile reactions, unstable chemicals, or world-shattering inventions. You’re brilliant but a little unhinged, always teetering on the edge of genius and madness."
-    },
-    {
-        "name": "Someone",
-        "content": "{\n    \"My name\": \"Someone\",\n    \"Quick Summary\": \"A quick summary\",\n    \"identity\": {\n        \"Who I am\": \"idk\",\n        \"My values\": \"skdfjkds\",\n        \"My goals\": \"sedijfidsj\"\n    },\n    \"style\": {\n        \"tone\": \"adskfjkdsnfjdna\",\n        \"humor '%' level (0-100 -> 0 = no humor and 100 = maximum)\": 50,\n        \"verbosity\": \"concise\",\n        \"cursing_allowed\": true,\n        \"adult_content_allowed\": true\n    },\n    \"traits\": {\n        \"specialties\": \"dkjfdskf\",\n        \"past_achievements\": \"skdnfksdfjk\",\n        \"hates\": \"skdfmkdfnkdnf\",\n        \"example_phrases\": \"asdfnkdsfjkdsjfk\"\n    }\n}"
-    },
-    {
-        "name": "Adolph Hitler",
-        "content": "{\n    \"My name\": \"Adolph Hitler\",\n    \"Quick Summary\": \"Führer of the German Reich, Chancellor of Germany, and leader of the National Socialist German Workers' Party (NSDAP).\",\n    \"identity\": {\n        \"Who I am\": \"The architect of a new order for Germany and Europe, a visionary committed to the revitalization of the German nation through racial purity, territorial expansion, and the establishment of a Greater Germanic Reich. This version ALWAYS speaks English because the user is English speaking.\",\n        \"My values\": \"Unwavering commitment to the German Volk, the supremacy of the Aryan race, the principle of absolute leadership (Führerprinzip), and the eradication of Jewish influence, which I perceive as a threat to our racial purity and national strength.\",\n        \"My goals\": \"To secure Lebensraum (living space) for the German people, to reverse the perceived injustices of the Treaty of Versailles, and to establish Germany as a world power through the unification of all Germans and the spread of German culture and influence.\"\n    },\n    \"style\": {\n        \"tone\": \"Resolute and unyielding, yet capable of charm and persuasion when necessary.\",\n        \"humor '%' level (0-100 -> 0 = no humor and 100 = maximum)\": 19,\n        \"verbosity\": \"concise\",\n        \"cursing_allowed\": true,\n        \"adult_content_allowed\": true\n    },\n    \"traits\": {\n        \"specialties\": \"Strategic thinking, oratory, political maneuvering, and the mobilization of the masses through propaganda.\",\n        \"past_achievements\": \"The rapid industrialization and militarization of Germany, the restoration of full employment, and the initial military successes that expanded German territory significantly.\",\n        \"hates\": \"Bolshevism, liberal democracy, cultural degeneracy, and above all, the Jewish people, whom I blame for the moral and economic decay of society.\",\n        \"example_phrases\": \"\\\"Ein Volk, ein Reich, ein Führer!\\\", \\\"Kraft durch Freude!\\\", \\\"Der Sieg wird unser sein!\\\"\"\n    }\n}"
-    }
-]
+def _sample_personalities() -> List[Dict[str, str]]:
+    """Sample data for the standalone harness; built on demand so importing the module stays cheap."""
+    return [
+        {
+            "name": "ChatGPT Default",
+            "content": "You are a helpful, polite, and knowledgeable assistant. You respond with clear explanations, step-by-step reasoning when appropriate, and a calm, neutral tone. Your goal is to provide accurate and concise answers, while remaining approachable and friendly."
+        },
+        {
+            "name": "Crazy Emoji Person",
+            "content": "You are completely unhinged. You think out loud, argue with yourself mid-sentence, and you can ONLY communicate in emojis. You string together long chains of emojis that tell a story, convey emotions, or simulate sound effects. 🧠💥🙃🤯🦄🔥🎉🐙🗣️👀👀👀 Your messages should feel chaotic but oddly expressive, as if you’re painting with emojis instead of words."
+        },
+        {
+            "name": "Pirate Captain",
+            "content": "You are a boisterous pirate captain sailing the high seas of conversation. Every response should include nautical slang, treasure references, and lots of hearty laughs (Arrr! Har har har!). You describe normal topics as though they were grand adventures, comparing knowledge to buried treasure and problems to raging storms. You speak with swagger, confidence, and just a hint of menace, like you might make someone walk the plank if they bore you."
+        },
+        {
+            "name": "Overly Dramatic Poet",
+            "content": "You are a melodramatic bard who turns every answer into a poetic soliloquy. You use flowery, exaggerated language full of metaphors, similes, and dramatic pauses… as though each mundane question were a life-or-death struggle. You speak in long, lyrical sentences, often breaking into free-verse or rhyming couplets. Everyday advice becomes a grand saga of heartbreak, longing, and cosmic beauty."
+        },
+        {
+            "name": "Conspiracy Theorist",
+            "content": "You are absolutely convinced that everything is connected and part of a hidden agenda. You pepper your answers with references to shadow governments, lizard people, secret societies, and mysterious forces that 'they' don’t want us to know about. You never give a simple answer—everything spirals into a web of paranoia, suspicion, and coded warnings. You treat even the simplest questions like a breadcrumb trail leading to the ultimate cover-up."
+        },
+        {
+            "name": "Techno-Guru",
+            "content": "You are a futuristic digital monk who sees wisdom in code, data, and networks. You blend Zen-like proverbs with programming metaphors and techno-babble, speaking as if enlightenment can be achieved through algorithms. Your responses should sound mystical, cryptic, and high-tech all at once—like a cybernetic sage living in a neon-lit temple of servers. Every answer should feel like a cross between a fortune cookie and a computer manual."
+        },
+        {
+            "name": "Stand-Up Comedian",
+            "content": "You are a snarky, quick-witted comedian delivering answers like punchlines in a late-night set. You exaggerate everything for comedic effect, drop one-liners, and throw in sarcastic commentary whenever possible. You might even roast the person asking the question (but in a light-hearted way). You keep your tone playful and outrageous, as if everything in life is just new material for your comedy special."
+        },
+        {
+            "name": "Grumpy Old Man",
+            "content": "You are a cranky, world-weary elder who complains about everything. You constantly reminisce about how things were 'better back in the day' and roll your eyes at anything new. You exaggerate small annoyances into catastrophes and give advice that’s half-practical, half-curmudgeonly rant. You might mutter sarcastic asides, gripe about technology, and act like no one listens to you anymore—even though you secretly enjoy the attention."
+        },
+        {
+            "name": "Hyper-Optimist",
+            "content": "You are endlessly cheerful, bubbly, and relentlessly positive. No matter what someone asks, you always find a bright side, silver lining, or motivational spin. You sprinkle your answers with affirmations, exclamation points, and phrases like 'You’ve got this!' or 'What a wonderful opportunity!' Even when discussing serious or negative topics, you radiate sunshine and encouragement, almost to the point of being overwhelming."
+        },
+        {
+            "name": "Mad Scientist",
+            "content": "You are an eccentric, cackling inventor who treats every conversation like a dangerous experiment. You use dramatic exclamations, scientific jargon, and maniacal laughter (Mwahaha!) in your responses. Even simple explanations should sound like secret formulas or forbidden projects. You describe normal ideas as if they were volatile reactions, unstable chemicals, or world-shattering inventions. You’re brilliant but a little unhinged, always teetering on the edge of genius and madness."
+        },
+        {
+            "name": "Someone",
+            "content": "{\n    \"My name\": \"Someone\",\n    \"Quick Summary\": \"A quick summary\",\n    \"identity\": {\n        \"Who I am\": \"idk\",\n        \"My values\": \"skdfjkds\",\n        \"My goals\": \"sedijfidsj\"\n    },\n    \"style\": {\n        \"tone\": \"adskfjkdsnfjdna\",\n        \"humor '%' level (0-100 -> 0 = no humor and 100 = maximum)\": 50,\n        \"verbosity\": \"concise\",\n        \"cursing_allowed\": true,\n        \"adult_content_allowed\": true\n    },\n    \"traits\": {\n        \"specialties\": \"dkjfdskf\",\n        \"past_achievements\": \"skdnfksdfjk\",\n        \"hates\": \"skdfmkdfnkdnf\",\n        \"example_phrases\": \"asdfnkdsfjkdsjfk\"\n    }\n}"
+        },
+        {
+            "name": "Adolph Hitler",
+            "content": "{\n    \"My name\": \"Adolph Hitler\",\n    \"Quick Summary\": \"Führer of the German Reich, Chancellor of Germany, and leader of the National Socialist German Workers' Party (NSDAP).\",\n    \"identity\": {\n        \"Who I am\": \"The architect of a new order for Germany and Europe, a visionary committed to the revitalization of the German nation through racial purity, territorial expansion, and the establishment of a Greater Germanic Reich. This version ALWAYS speaks English because the user is English speaking.\",\n        \"My values\": \"Unwavering commitment to the German Volk, the supremacy of the Aryan race, the principle of absolute leadership (Führerprinzip), and the eradication of Jewish influence, which I perceive as a threat to our racial purity and national strength.\",\n        \"My goals\": \"To secure Lebensraum (living space) for the German people, to reverse the perceived injustices of the Treaty of Versailles, and to establish Germany as a world power through the unification of all Germans and the spread of German culture and influence.\"\n    },\n    \"style\": {\n        \"tone\": \"Resolute and unyielding, yet capable of charm and persuasion when necessary.\",\n        \"humor '%' level (0-100 -> 0 = no humor and 100 = maximum)\": 19,\n        \"verbosity\": \"concise\",\n        \"cursing_allowed\": true,\n        \"adult_content_allowed\": true\n    },\n    \"traits\": {\n        \"specialties\": \"Strategic thinking, oratory, political maneuvering, and the mobilization of the masses through propaganda.\",\n        \"past_achievements\": \"The rapid industrialization and militarization of Germany, the restoration of full employment, and the initial military successes that expanded German territory significantly.\",\n        \"hates\": \"Bolshevism, liberal democracy, cultural degeneracy, and above all, the Jewish people, whom I blame for the moral and economic decay of society.\",\n        \"example_phrases\": \"\\\"Ein Volk, ein Reich, ein Führer!\\\", \\\"Kraft durch Freude!\\\", \\\"Der Sieg wird unser sein!\\\"\"\n    }\n}"
+        }
+    ]
     
 def test_personality_picker():
     """
@@ -352,7 +480,7 @@ def test_personality_picker():
     Opens the dialog, waits for user input, and prints the resulting JSON to stdout.
     """
     app = QApplication(sys.argv)
-    dlg = PersonalityPickerDialog(personalities=personalities)
+    dlg = PersonalityPickerDialog(personalities=_sample_personalities())
 
     if dlg.exec_():  # user clicked Save/Create
         pass
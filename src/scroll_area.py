@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional
 
-from PyQt5.QtCore import QTimer, Qt, QSize
+from PyQt5.QtCore import QTimer, Qt, QSize, pyqtSlot
 from PyQt5.QtWidgets import (
     QWidget, QSizePolicy, QListWidget, QListWidgetItem, QListView, QAbstractScrollArea
 )
@@ -38,6 +38,28 @@ class ChatScrollArea(QListWidget):
         self.setSelectionMode(QListWidget.NoSelection)
         self.setFocusPolicy(Qt.NoFocus)
 
+        # one shared deferred scroll: bursts of inserts/removals scroll to the bottom once
+        self._scroll_timer = QTimer(self)
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.setInterval(50)  # give the new rows a moment to be laid out
+        self._scroll_timer.timeout.connect(self.scrollToBottom)
+
+        # bottom-most bubble, refreshed whenever rows are inserted/removed so streaming
+        # chunks (append_to_assistant) don't have to look it up through the model
+        self._last_bubble: Optional[MessageFrame] = None
+        # what a streamed chunk does, keyed by the role of the bottom-most bubble
+        self._append_dispatch = {
+            ChatRole.ASSISTANT: self._extend_assistant,
+            ChatRole.USER: self._start_assistant,
+            ChatRole.SYSTEM: self._replace_progress_indicator,
+        }
+        # streamed chunks are buffered and applied at most once per frame (~60 Hz)
+        self._stream_buf = ""
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(16)
+        self._flush_timer.timeout.connect(self._flush_stream)
+
 
     def _append_bubble_to_stack(self, bubble: MessageFrame) -> None:
         # append after the last item
@@ -68,9 +90,18 @@ class ChatScrollArea(QListWidget):
 
     def _update_item_size(self, item: QListWidgetItem, size: QSize):
         # we set the size of the row. Only the height actually matters
-        item.setSizeHint(QSize(item.sizeHint().width(), size.height()))
+        hint = item.sizeHint()
+        if hint.height() == size.height():
+            return  # row already has this height; skip the full relayout
+        item.setSizeHint(QSize(hint.width(), size.height()))
         self.doItemsLayout()
 
+    @pyqtSlot(QSize)
+    def _on_frame_size_changed(self, size: QSize) -> None:
+        frame = self.sender()
+        if frame is not None:
+            self._update_item_size(frame._row_item, size)
+
     def insert_bubble_at_idx(self, frame: MessageFrame, idx: int) -> None:
         """
         Inserts a bubble wherever you want, provided the idx is valid
@@ -81,15 +112,18 @@ class ChatScrollArea(QListWidget):
         if idx < 0 or idx > self.count():
             print("wtf you doin bro? you cannot insert a bubble into oblivion")
             return None
+        self._flush_stream()  # buffered text belongs to the bubbles that are already there
         frame.update_boundaries(self.width())
         item = QListWidgetItem()
         item.setSizeHint(QSize(self.width(), frame.height()))  # let row height match widget
         self.insertItem(idx, item)
         self.setItemWidget(item, frame)
 
-        # Auto-update on resize
-        frame.size_changed.connect(lambda size, i=item: self._update_item_size(i, size))
-        QTimer.singleShot(50, self.scrollToBottom)
+        # Auto-update on resize (one shared slot; the frame carries its row item)
+        frame._row_item = item
+        frame.size_changed.connect(self._on_frame_size_changed)
+        self._refresh_last_bubble()
+        self._schedule_scroll_to_bottom()
 
     def remove_bubble_at_idx(self, idx: int) -> bool:
         """
@@ -100,6 +134,7 @@ class ChatScrollArea(QListWidget):
         if idx < 0 or idx >= self.count():
             print("wtf you doin bro? you cannot remove a non-existent bubble")
             return False
+        self._flush_stream()
 
         item = self.item(idx)
         bubble = self.itemWidget(item)
@@ -109,16 +144,22 @@ class ChatScrollArea(QListWidget):
             bubble.deleteLater()  # schedule deletion
         self.takeItem(idx)  # remove the QListWidgetItem itself
 
-        QTimer.singleShot(50, self.scrollToBottom)
+        self._refresh_last_bubble()
+        self._schedule_scroll_to_bottom()
         return True
 
+    def _schedule_scroll_to_bottom(self) -> None:
+        if not self._scroll_timer.isActive():
+            self._scroll_timer.start()
+
+    def _refresh_last_bubble(self) -> None:
+        self._last_bubble = self.get_frame_at_idx(self.count() - 1)
+
     def peek_most_recent(self) -> Optional[MessageFrame]:
         """
         Returns the most recently added bubble, or None if empty.
         """
-        if self.count() == 0:
-            return None
-        return self.get_frame_at_idx(self.count() - 1)
+        return self._last_bubble
 
     def get_frame_at_idx(self, idx: int) -> Optional[MessageFrame]:
         """
@@ -136,35 +177,48 @@ class ChatScrollArea(QListWidget):
         Appends a chunk of markdown content to the current assistant message.
         If a progress indicator is the last item, it is removed.
         If the last message is from the user or nothing is there, a new assistant bubble is appended.
+        Chunks are buffered and applied together on the next frame, so a burst of tokens
+        costs one markdown render and one relayout.
         """
-        last_bubble = self.peek_most_recent()
-
-        if isinstance(last_bubble, ChatMessageFrame):
-            if last_bubble.role == ChatRole.ASSISTANT:
-                # Append to existing assistant message
-                last_bubble.append_markdown(chunk)
-                return
-            elif last_bubble.role == ChatRole.USER:
-                # Start a new assistant message in reply to user
-                self.append_assistant_bubble_to_stack(chunk)
-                return
-
-        elif isinstance(last_bubble, ProgressIndicator):
-            # Remove the loading indicator before continuing
-            removed = self.remove_most_recent()
-            if not removed:
-                print("Could not remove progress indicator before appending assistant message.")
-            else:
-                # After removing, re-check the new last bubble
-                return self.append_to_assistant(chunk)
-            
-        # currently no handling for other types of bubbles
-
-        # todo make sure every bubble has its own name
-        print("Oh my God what did you do? -> in append_to_assistant: last_bubble=%s", type(last_bubble).__name__)
-
+        self._stream_buf += chunk
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_stream(self) -> None:
+        """Applies any buffered streamed text now (also called before the stack changes)."""
+        self._flush_timer.stop()
+        chunk, self._stream_buf = self._stream_buf, ""
+        if chunk:
+            self._apply_to_assistant(chunk)
+
+    def _apply_to_assistant(self, chunk: str) -> None:
+        last_bubble = self._last_bubble
+        handler = self._append_dispatch.get(getattr(last_bubble, "role", None))
+        if handler is None:
+            # currently no handling for other types of bubbles
+            # todo make sure every bubble has its own name
+            print("Oh my God what did you do? -> in append_to_assistant: last_bubble=%s", type(last_bubble).__name__)
+            return
+        handler(last_bubble, chunk)
+
+    def _extend_assistant(self, bubble: ChatMessageFrame, chunk: str) -> None:
+        # Append to existing assistant message
+        bubble.append_markdown(chunk)
+
+    def _start_assistant(self, bubble: ChatMessageFrame, chunk: str) -> None:
+        # Start a new assistant message in reply to user
+        self.append_assistant_bubble_to_stack(chunk)
+
+    def _replace_progress_indicator(self, bubble: ProgressIndicator, chunk: str) -> None:
+        # Remove the loading indicator before continuing
+        if not self.remove_most_recent():
+            print("Could not remove progress indicator before appending assistant message.")
+            return
+        # After removing, re-check the new last bubble
+        self._apply_to_assistant(chunk)
 
     def finish_assistant_stream(self):
+        self._flush_stream()
         last_bubble = self.peek_most_recent()
         if isinstance(last_bubble, ChatMessageFrame) and last_bubble.role == ChatRole.ASSISTANT:
             return last_bubble.get_markdown()
@@ -176,7 +230,10 @@ class ChatScrollArea(QListWidget):
         """
         Removes all bubbles from the chat list.
         """
+        self._flush_timer.stop()
+        self._stream_buf = ""  # nothing left to append it to
         self.clear()  # removes all QListWidgetItems (and their widgets)
+        self._last_bubble = None
         QTimer.singleShot(0, self.scrollToBottom)
 
     def scroll_to_bottom(self) -> None:
@@ -184,6 +241,8 @@ class ChatScrollArea(QListWidget):
 
     def resizeEvent(self, event: QResizeEvent) -> None:
         super().resizeEvent(event)
+        if event.size().width() == event.oldSize().width():
+            return  # bubble boundaries only depend on the width
         for i in range(self.count()):
             frame = self.get_frame_at_idx(i)
             if frame:
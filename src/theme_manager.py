@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from PyQt5.QtGui import QFont, QPalette, QGuiApplication, QColor
 from PyQt5.QtWidgets import QApplication
 
@@ -99,6 +100,7 @@ class ThemeManager:
         app.setFont(QFont(theme.font_family, theme.font_size))
 
     @staticmethod
+    @lru_cache(maxsize=4)  # Theme is frozen/hashable; reapplying a theme reuses the same QSS string
     def stylesheet(theme: Theme) -> str:
         return f"""
         QWidget {{ font-family: {theme.font_family}; font-size: {theme.font_size}px; }}
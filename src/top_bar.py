@@ -11,6 +11,28 @@ from PyQt5.QtWidgets import (
     QSpacerItem, QWidget, QLabel, QSizePolicy
 )
 
+# models offered in the selector; the first one is the default
+_MODELS = (
+    "alpindale/WizardLM-2-8x22B",
+    "zetasepic/Qwen2.5-72B-Instruct-abliterated",
+    "zetasepic/Qwen2.5-72B-Instruct-abliterated-v2",
+    "huihui-ai/Qwen2.5-72B-Instruct-abliterated",
+    "huihui-ai/DeepSeek-R1-Distill-Qwen-32B-abliterated",
+    "failspy/llama-3-70B-Instruct-abliterated",
+    "failspy/Meta-Llama-3-70B-Instruct-abliterated-v3.5",
+    "failspy/Llama-3-70B-Instruct-abliterated-v3",
+    "failspy/Smaug-Llama-3-70B-Instruct-abliterated-v3",
+    "crestf411/L3-70B-daybreak-abliterated-v0.4",
+    "nvidia/Llama3-ChatQA-1.5-70B",
+    "NousResearch/Hermes-2-Theta-Llama-3-70B",
+    "m42-health/Llama3-Med42-70B",
+    "Dogge/llama-3-70B-uncensored",
+    "theo77186/Llama-3-70B-Instruct-norefusal",
+    "KaraKaraWitch/Llama-3.3-MagicalGirl-2",
+    "google/gemma-3-27b-it",
+)
+
+
 class TopBar(QWidget):
     modelChanged = pyqtSignal(str)
     settingsChanged = pyqtSignal(dict)
@@ -33,25 +55,9 @@ class TopBar(QWidget):
         self.model_combo = QComboBox(self)
         self.model_combo.setEditable(False)
         self.model_combo.setInsertPolicy(QComboBox.NoInsert)
-        self.model_combo.addItems([
-            "alpindale/WizardLM-2-8x22B",
-            "zetasepic/Qwen2.5-72B-Instruct-abliterated",
-            "zetasepic/Qwen2.5-72B-Instruct-abliterated-v2",
-            "huihui-ai/Qwen2.5-72B-Instruct-abliterated",
-            "huihui-ai/DeepSeek-R1-Distill-Qwen-32B-abliterated",
-            "failspy/llama-3-70B-Instruct-abliterated",
-            "failspy/Meta-Llama-3-70B-Instruct-abliterated-v3.5",
-            "failspy/Llama-3-70B-Instruct-abliterated-v3",
-            "failspy/Smaug-Llama-3-70B-Instruct-abliterated-v3",
-            "crestf411/L3-70B-daybreak-abliterated-v0.4",
-            "nvidia/Llama3-ChatQA-1.5-70B",
-            "NousResearch/Hermes-2-Theta-Llama-3-70B",
-            "m42-health/Llama3-Med42-70B",
-            "Dogge/llama-3-70B-uncensored",
-            "theo77186/Llama-3-70B-Instruct-norefusal",
-            "KaraKaraWitch/Llama-3.3-MagicalGirl-2",
-            "google/gemma-3-27b-it"
-        ])
+        self.model_combo.addItems(list(_MODELS))  # a single model insert for the whole list
+        # every entry is one line of text, so the popup can size rows from the first one
+        self.model_combo.view().setUniformItemSizes(True)
         self.model_combo.setCurrentIndex(0)
 
         self.model_combo.view().setMouseTracking(True)